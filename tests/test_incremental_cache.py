@@ -0,0 +1,188 @@
+"""Tests for the incremental build and rerun caches."""
+
+import json
+import os
+import sys
+import types
+
+from unittest.mock import patch, MagicMock
+
+# ai_c_test_generator lives in a sibling checkout that isn't available in
+# test environments; stub the import so ai_test_runner.cli can be loaded.
+# An empty dependency_map exercises the analyzer-less fallback paths.
+if "ai_c_test_generator" not in sys.modules:
+    _pkg = types.ModuleType("ai_c_test_generator")
+    _analyzer = types.ModuleType("ai_c_test_generator.analyzer")
+
+    class _StubDependencyAnalyzer:
+        def __init__(self, repo_path):
+            self.dependency_map = {}
+
+    _analyzer.DependencyAnalyzer = _StubDependencyAnalyzer
+    _pkg.analyzer = _analyzer
+    sys.modules["ai_c_test_generator"] = _pkg
+    sys.modules["ai_c_test_generator.analyzer"] = _analyzer
+
+from ai_test_runner.cli import AITestRunner
+
+
+SOURCE_V1 = "float raw_to_celsius(int raw) { return raw * 0.5f; }\n"
+SOURCE_V2 = "float raw_to_celsius(int raw) { return raw * 0.25f; }\n"
+TEST_FILE = "void test_conversion(void) {}\nint main(void) { return 0; }\n"
+
+UNITY_PASS_OUTPUT = b"test_temp.c:1:test_conversion:PASS\n\n1 Tests 0 Failures 0 Ignored\nOK\n"
+
+
+def _make_runner(tmp_path):
+    """Create a runner over a throwaway repo with one source and one test
+    already mirrored into the build directory."""
+    runner = AITestRunner(repo_path=str(tmp_path))
+    (runner.output_dir / "src" / "temp.c").write_text(SOURCE_V1)
+    (runner.output_dir / "tests" / "test_temp.c").write_text(TEST_FILE)
+    return runner
+
+
+def _make_executable(runner, name="test_temp"):
+    """Drop a fake built test binary into the build dir."""
+    exe = runner.output_dir / name
+    exe.write_text("")
+    os.chmod(exe, 0o755)
+    return exe
+
+
+def _passing_result(name="test_temp"):
+    return {
+        'name': name,
+        'success': True,
+        'output': 'OK',
+        'errors': '',
+        'returncode': 0,
+        'individual_tests': 1,
+        'individual_passed': 1,
+        'individual_failed': 0,
+    }
+
+
+class TestTargetHashes:
+    """The per-target input hashes computed by create_cmake_lists."""
+
+    def test_source_edit_invalidates_target_hash(self, tmp_path):
+        """Editing a linked source must change the target's input hash."""
+        runner = _make_runner(tmp_path)
+        runner.create_cmake_lists(['test_temp.c'])
+        first = runner._pending_target_hashes['test_temp']
+
+        (runner.output_dir / "src" / "temp.c").write_text(SOURCE_V2)
+        runner.create_cmake_lists(['test_temp.c'])
+
+        assert runner._pending_target_hashes['test_temp'] != first
+
+    def test_test_edit_invalidates_target_hash(self, tmp_path):
+        """Editing the test file itself must change the hash too."""
+        runner = _make_runner(tmp_path)
+        runner.create_cmake_lists(['test_temp.c'])
+        first = runner._pending_target_hashes['test_temp']
+
+        (runner.output_dir / "tests" / "test_temp.c").write_text(
+            TEST_FILE + "void test_extra(void) {}\n")
+        runner.create_cmake_lists(['test_temp.c'])
+
+        assert runner._pending_target_hashes['test_temp'] != first
+
+    def test_unchanged_target_is_excluded_from_build(self, tmp_path):
+        """A target matching the last successful build is declared
+        EXCLUDE_FROM_ALL and marked for coverage-data reuse."""
+        runner = _make_runner(tmp_path)
+        runner.create_cmake_lists(['test_temp.c'])
+        # Simulate the successful build that persists the hashes
+        (runner.output_dir / ".target_hashes.json").write_text(
+            json.dumps(runner._pending_target_hashes))
+        _make_executable(runner)
+
+        runner.create_cmake_lists(['test_temp.c'])
+
+        assert 'test_temp' in runner._reused_targets
+        assert 'EXCLUDE_FROM_ALL' in (runner.output_dir / "CMakeLists.txt").read_text()
+
+    def test_source_edit_forces_recompile(self, tmp_path):
+        """An edited source disqualifies the target from binary reuse."""
+        runner = _make_runner(tmp_path)
+        runner.create_cmake_lists(['test_temp.c'])
+        (runner.output_dir / ".target_hashes.json").write_text(
+            json.dumps(runner._pending_target_hashes))
+        _make_executable(runner)
+
+        (runner.output_dir / "src" / "temp.c").write_text(SOURCE_V2)
+        runner.create_cmake_lists(['test_temp.c'])
+
+        assert runner._reused_targets == set()
+        assert 'EXCLUDE_FROM_ALL' not in (runner.output_dir / "CMakeLists.txt").read_text()
+
+
+class TestRunCache:
+    """The cached run results consulted by run_tests."""
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_unchanged_test_reuses_cached_result(self, mock_subprocess, tmp_path):
+        """A cached passing result with a matching hash is replayed without
+        spawning the executable."""
+        runner = _make_runner(tmp_path)
+        _make_executable(runner)
+        runner._pending_target_hashes = {'test_temp': 'abc123'}
+        (runner.output_dir / ".ai_runner_cache.json").write_text(json.dumps(
+            {'test_temp': {'hash': 'abc123', 'result': _passing_result()}}))
+
+        results = runner.run_tests()
+
+        mock_subprocess.assert_not_called()
+        assert len(results) == 1
+        assert results[0]['success']
+        assert runner.passed_test_executables == ['test_temp']
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_stale_hash_reruns_the_test(self, mock_subprocess, tmp_path):
+        """A cached result recorded against different inputs is ignored."""
+        mock_subprocess.return_value = MagicMock(
+            returncode=0, stdout=UNITY_PASS_OUTPUT, stderr=b'')
+        runner = _make_runner(tmp_path)
+        _make_executable(runner)
+        runner._pending_target_hashes = {'test_temp': 'new-hash'}
+        (runner.output_dir / ".ai_runner_cache.json").write_text(json.dumps(
+            {'test_temp': {'hash': 'old-hash', 'result': _passing_result()}}))
+
+        results = runner.run_tests()
+
+        mock_subprocess.assert_called_once()
+        assert len(results) == 1
+        assert results[0]['success']
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_failures_are_never_cached(self, mock_subprocess, tmp_path):
+        """Failed runs must not be written back to the run cache."""
+        mock_subprocess.return_value = MagicMock(
+            returncode=1, stdout=b'', stderr=b'segfault')
+        runner = _make_runner(tmp_path)
+        _make_executable(runner)
+        runner._pending_target_hashes = {'test_temp': 'abc123'}
+
+        results = runner.run_tests()
+
+        assert not results[0]['success']
+        cache_file = runner.output_dir / ".ai_runner_cache.json"
+        cached = json.loads(cache_file.read_text()) if cache_file.exists() else {}
+        assert 'test_temp' not in cached
+
+    @patch('ai_test_runner.cli.subprocess.run')
+    def test_passing_run_is_cached_with_its_hash(self, mock_subprocess, tmp_path):
+        """A fresh passing run lands in the cache keyed by its input hash."""
+        mock_subprocess.return_value = MagicMock(
+            returncode=0, stdout=UNITY_PASS_OUTPUT, stderr=b'')
+        runner = _make_runner(tmp_path)
+        _make_executable(runner)
+        runner._pending_target_hashes = {'test_temp': 'abc123'}
+
+        runner.run_tests()
+
+        cached = json.loads((runner.output_dir / ".ai_runner_cache.json").read_text())
+        assert cached['test_temp']['hash'] == 'abc123'
+        assert cached['test_temp']['result']['success']